@@ -1,22 +1,40 @@
+import numpy as np
 import pandas as pd
 import matplotlib.pyplot as plt
 
+try:
+    import numba
+except ImportError:
+    numba = None
+
 INPUT_CSV = "results.csv"
 PIE_FILE = "model_safety_pie_chart.png"
 
-df = pd.read_csv(INPUT_CSV)
+# Index in this list is the status code written by classify_files
+STATUSES = ["unsafe", "partially_safe", "safe", "unknown"]
+
+# First matching condition wins: unsafe > partially_safe > safe > unknown
+if numba is not None:
+    @numba.njit(cache=True, parallel=True)
+    def classify_files(unsafe, partial, safe, out):
+        for i in numba.prange(unsafe.size):
+            if unsafe[i] > 0:
+                out[i] = 0
+            elif partial[i] > 0:
+                out[i] = 1
+            elif safe[i] > 0:
+                out[i] = 2
+            else:
+                out[i] = 3
+else:
+    def classify_files(unsafe, partial, safe, out):
+        out[:] = np.select([unsafe > 0, partial > 0, safe > 0], [0, 1, 2], default=3)
 
-def classify_file(row):
-    if row["unsafe_usages"] > 0:
-        return "unsafe"
-    elif row["partial_usages"] > 0:
-        return "partially_safe"
-    elif row["safe_usages"] > 0:
-        return "safe"
-    else:
-        return "unknown"
+df = pd.read_csv(INPUT_CSV)
 
-df["status"] = df.apply(classify_file, axis=1)
+codes = np.empty(len(df), dtype=np.uint8)
+classify_files(df["unsafe_usages"].values, df["partial_usages"].values, df["safe_usages"].values, codes)
+df["status"] = pd.Categorical.from_codes(codes, categories=STATUSES).remove_unused_categories()
 
 
 status_counts = df["status"].value_counts()
@@ -26,15 +44,19 @@ print(status_counts)
 
 
 colors = {"safe": "green", "partially_safe": "orange", "unsafe": "red", "unknown": "gray"}
-status_counts.plot.pie(
+fig, ax = plt.subplots(figsize=(6, 6))
+counts = status_counts.to_numpy()
+labels = status_counts.index.to_numpy()
+ax.pie(
+    counts,
+    labels=labels,
     autopct="%1.1f%%",
-    figsize=(6, 6),
     startangle=90,
-    colors=[colors.get(k, "gray") for k in status_counts.index],
-    title="Hugging Face Model Pinning Classification (per file)"
+    colors=[colors.get(k, "gray") for k in labels]
 )
+ax.set_title("Hugging Face Model Pinning Classification (per file)")
 
-plt.ylabel("")
-plt.tight_layout()
-plt.savefig(PIE_FILE)
+fig.tight_layout()
+fig.savefig(PIE_FILE)
+plt.close(fig)
 print(f"\nSaved pie chart to: {PIE_FILE}")
@@ -4,63 +4,163 @@ Analysis script for hfscanner.csv data
 Loads the CSV data into a pandas DataFrame and displays it with nice formatting
 """
 
+import numpy as np
 import pandas as pd
+import matplotlib
 import matplotlib.pyplot as plt
 import seaborn as sns
 import os
+import sys
+
+try:
+    import pyarrow  # noqa: F401
+    HAS_PYARROW = True
+except ImportError:
+    HAS_PYARROW = False
+
+# Usage counts per file comfortably fit in 32 bits
+USAGE_DTYPES = {
+    'safe_usages': 'int32',
+    'partial_usages': 'int32',
+    'unsafe_usages': 'int32'
+}
+
+# hfscanner.csv lives in the results folder next to this script
+CSV_FILE = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'results/hfscanner.csv')
+
+# Rows per chunk when streaming the CSV; 0 loads the whole file at once
+CHUNK_SIZE = int(os.environ.get('HFSCAN_CHUNKSIZE', 0))
+
+# Resolution for saved charts; override with HFSCAN_DPI for print-quality output
+FIGURE_DPI = int(os.environ.get('HFSCAN_DPI', 150))
+
+# Print the extra diagnostic statistics when HFSCAN_VERBOSE is set
+VERBOSE = bool(os.environ.get('HFSCAN_VERBOSE'))
+
+# Non-interactive backends can only write files, so plt.show() would be a no-op
+NON_INTERACTIVE_BACKENDS = {'agg', 'pdf', 'svg', 'ps', 'cairo', 'template'}
+
+# Only open interactive chart windows from a terminal on a GUI backend
+SHOW_PLOTS = sys.stdout.isatty() and matplotlib.get_backend().lower() not in NON_INTERACTIVE_BACKENDS
 
 # Set style for better looking plots
 plt.style.use('default')
 sns.set_palette("husl")
 
+def add_total_usages(df):
+    """
+    Add the per-file total, computed once and summed by every aggregation downstream
+    """
+    df['total_usages'] = df[['safe_usages', 'partial_usages', 'unsafe_usages']].sum(axis=1).astype('int32')
+    return df
+
+def prepare_usage_columns(df):
+    """
+    Convert the key columns to categoricals and add the per-file total
+    """
+    # org/repo are heavily repeated keys, so group on integer category codes
+    df['org'] = df['org'].astype('category')
+    df['repo'] = df['repo'].astype('category')
+
+    return add_total_usages(df)
+
+def exclude_huggingface_transformers(df):
+    """
+    Drop the huggingface/transformers rows, which are excluded from all visualizations
+    """
+    return df[~((df['org'] == 'huggingface') & (df['repo'] == 'transformers'))]
+
 def load_hfscanner_data():
     """
     Load the hfscanner.csv data into a pandas DataFrame
     """
-    # Get the current directory (results folder)
-    current_dir = os.path.dirname(os.path.abspath(__file__))
-    csv_file = os.path.join(current_dir, 'results/hfscanner.csv')
+    # Load the CSV data with explicit dtypes instead of letting pandas infer them
+    if HAS_PYARROW:
+        dtypes = {**USAGE_DTYPES, 'org': 'string[pyarrow]', 'repo': 'string[pyarrow]', 'file': 'string[pyarrow]'}
+        df = pd.read_csv(CSV_FILE, engine='pyarrow', dtype=dtypes)
+    else:
+        df = pd.read_csv(CSV_FILE, dtype=USAGE_DTYPES)
 
-    # Load the CSV data
-    df = pd.read_csv(csv_file)
+    return prepare_usage_columns(df)
 
-    return df
+def aggregate_repo_stats(df):
+    """
+    Aggregate per-file usages into per-repository totals
+    """
+    # Sorted keys keep tie-breaking in the downstream nlargest/sort_values calls deterministic
+    return df.groupby(['org', 'repo'], observed=True).agg(
+        safe_usages=('safe_usages', 'sum'),
+        partial_usages=('partial_usages', 'sum'),
+        unsafe_usages=('unsafe_usages', 'sum'),
+        file=('file', 'count'),
+        total_usages=('total_usages', 'sum')
+    ).reset_index()
+
+def aggregate_org_stats(repo_stats):
+    """
+    Aggregate per-repository totals into per-organization totals
+    """
+    # Organization totals are derived from the (much smaller) repository totals
+    return repo_stats.groupby('org', observed=True).sum(numeric_only=True).reset_index()
 
-def create_bubble_charts(df):
+def stream_repo_stats(chunksize):
     """
-    Create separate bubble charts for organizations and repositories
+    Aggregate hfscanner.csv into per-repository totals chunk by chunk,
+    without holding every file-level row in memory
+    """
+    # The pyarrow engine does not support chunked reads, so this always uses the C engine
+    chunks = pd.read_csv(CSV_FILE, chunksize=chunksize, dtype=USAGE_DTYPES)
+    # Chunks are not converted to categoricals: each chunk would get its own
+    # categories, and pd.concat would turn the mismatched columns back into strings
+    partials = [
+        aggregate_repo_stats(exclude_huggingface_transformers(add_total_usages(chunk)))
+        for chunk in chunks
+    ]
+
+    # Sums and counts are decomposable, so merging the partial totals gives the full result;
+    # the merged keys are converted to categoricals once
+    repo_stats = pd.concat(partials, ignore_index=True).astype({'org': 'category', 'repo': 'category'})
+    return repo_stats.groupby(['org', 'repo'], observed=True).sum(numeric_only=True).reset_index()
+
+def format_repo_labels(frame, max_length):
     """
-    # Calculate total usages for each org and repo
-    org_stats = df.groupby('org').agg({
-        'safe_usages': 'sum',
-        'partial_usages': 'sum',
-        'unsafe_usages': 'sum',
-        'file': 'count'
-    }).reset_index()
+    Build "org/repo" labels, shortening repo names longer than max_length
+    """
+    repo = frame['repo'].astype(str)
+    short_repo = repo.where(repo.str.len() <= max_length, repo.str.slice(0, max_length) + '...')
+    return (frame['org'].astype(str) + '/' + short_repo).to_numpy()
 
-    org_stats['total_usages'] = org_stats['safe_usages'] + org_stats['partial_usages'] + org_stats['unsafe_usages']
+def print_repo_safety(frame):
+    """
+    Print one "org/repo: X% safe (N total usages)" line per repository
+    """
+    if frame.empty:
+        return
+
+    # Build the whole block with vectorized string ops and write it at once
+    safety_pct = np.char.mod('%.1f', frame['safety_ratio'].to_numpy() * 100)
+    lines = (
+        "  " + frame['org'].astype(str) + "/" + frame['repo'].astype(str) + ": " +
+        safety_pct + "% safe (" + frame['total_usages'].astype(str) + " total usages)"
+    )
+    sys.stdout.write("\n".join(lines.tolist()) + "\n")
 
+def create_bubble_charts(org_stats, repo_stats):
+    """
+    Create separate bubble charts for organizations and repositories
+    """
     # Exclude the huggingface org from the org bubble chart
     org_stats = org_stats[org_stats['org'] != 'huggingface']
 
-    repo_stats = df.groupby(['org', 'repo']).agg({
-        'safe_usages': 'sum',
-        'partial_usages': 'sum',
-        'unsafe_usages': 'sum',
-        'file': 'count'
-    }).reset_index()
-
-    repo_stats['total_usages'] = repo_stats['safe_usages'] + repo_stats['partial_usages'] + repo_stats['unsafe_usages']
-
     # Create organizations bubble chart
-    plt.figure(figsize=(14, 10))
+    fig, ax = plt.subplots(figsize=(14, 10))
 
     top_orgs = org_stats.nlargest(15, 'total_usages')
 
     # Scale bubble sizes to be more reasonable
     bubble_sizes_orgs = top_orgs['total_usages'] * 5  # Reduced from 25
 
-    scatter_orgs = plt.scatter(
+    scatter_orgs = ax.scatter(
         top_orgs['total_usages'],
         top_orgs['file'],
         s=bubble_sizes_orgs,
@@ -68,65 +168,59 @@ def create_bubble_charts(df):
         c=top_orgs['unsafe_usages'],  # Color based on unsafe usages
         cmap='Reds',
         edgecolors='black',
-        linewidth=1
+        linewidth=1,
+        rasterized=True
     )
 
+    # Bucket bubbles by size: small (<= 500), medium (<= 2000), large (> 2000)
+    org_buckets = np.digitize(top_orgs['total_usages'].to_numpy(), [500, 2000], right=True)
+    org_xytexts = [(5, 5), (8, 8), (10, 10)]
+    org_fontsizes = [7, 8, 9]
+
     # Add labels for each bubble with better positioning
-    for idx, row in top_orgs.iterrows():
-        # Calculate label position to avoid overlap
-        x_pos = row['total_usages']
-        y_pos = row['file']
-
-        # Adjust label position based on bubble size
-        if row['total_usages'] > 2000:  # Large bubbles
-            xytext = (10, 10)
-            fontsize = 9
-        elif row['total_usages'] > 500:  # Medium bubbles
-            xytext = (8, 8)
-            fontsize = 8
-        else:  # Small bubbles
-            xytext = (5, 5)
-            fontsize = 7
-
-        plt.annotate(
-            row['org'],
+    org_rows = top_orgs[['org', 'total_usages', 'file']].itertuples(index=False, name=None)
+    for bucket, (org, x_pos, y_pos) in zip(org_buckets, org_rows):
+        ax.annotate(
+            org,
             (x_pos, y_pos),
-            xytext=xytext,
+            xytext=org_xytexts[bucket],
             textcoords='offset points',
-            fontsize=fontsize,
+            fontsize=org_fontsizes[bucket],
             ha='left',
             va='bottom',
             weight='bold',
             bbox=dict(boxstyle='round,pad=0.3', facecolor='white', alpha=0.8, edgecolor='gray')
         )
 
-    plt.xlabel('Total Hugging Face Usages', fontsize=12)
-    plt.ylabel('Number of Files', fontsize=12)
-    plt.title('Top Organizations by Hugging Face Usage\n(Bubble size = total usages, Color = unsafe usages)', fontsize=14, weight='bold')
-    plt.grid(True, alpha=0.3)
+    ax.set_xlabel('Total Hugging Face Usages', fontsize=12)
+    ax.set_ylabel('Number of Files', fontsize=12)
+    ax.set_title('Top Organizations by Hugging Face Usage\n(Bubble size = total usages, Color = unsafe usages)', fontsize=14, weight='bold')
+    ax.grid(True, alpha=0.3)
 
     # Add colorbar for unsafe usages
-    cbar_orgs = plt.colorbar(scatter_orgs)
+    cbar_orgs = fig.colorbar(scatter_orgs, ax=ax)
     cbar_orgs.set_label('Unsafe Usages', fontsize=10)
 
-    plt.tight_layout()
+    fig.tight_layout()
 
     # Save the organizations chart
     org_output_file = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'hfscanner_organizations.png')
-    plt.savefig(org_output_file, dpi=300, bbox_inches='tight')
+    fig.savefig(org_output_file, dpi=FIGURE_DPI)
     print(f"Organizations chart saved to: {org_output_file}")
 
-    plt.show()
+    if SHOW_PLOTS:
+        plt.show()
+    plt.close(fig)
 
     # Create repositories bubble chart
-    plt.figure(figsize=(16, 12))
+    fig, ax = plt.subplots(figsize=(16, 12))
 
     top_repos = repo_stats.nlargest(20, 'total_usages')
 
     # Scale bubble sizes to be more reasonable
     bubble_sizes_repos = top_repos['total_usages'] * 3  # Reduced from 20
 
-    scatter_repos = plt.scatter(
+    scatter_repos = ax.scatter(
         top_repos['total_usages'],
         top_repos['file'],
         s=bubble_sizes_repos,
@@ -134,140 +228,108 @@ def create_bubble_charts(df):
         c=top_repos['unsafe_usages'],  # Color based on unsafe usages
         cmap='Reds',
         edgecolors='black',
-        linewidth=1
+        linewidth=1,
+        rasterized=True
     )
 
+    # Bucket bubbles by size: small (<= 300), medium (<= 1000), large (> 1000)
+    repo_buckets = np.digitize(top_repos['total_usages'].to_numpy(), [300, 1000], right=True)
+    repo_xytexts = [(5, 5), (8, 8), (12, 12)]
+    repo_fontsizes = [6, 7, 8]
+
+    # Shorten repo names for better readability
+    repo_labels = format_repo_labels(top_repos, 15)
+
     # Add labels for each bubble with better positioning
-    for idx, row in top_repos.iterrows():
-        # Calculate label position to avoid overlap
-        x_pos = row['total_usages']
-        y_pos = row['file']
-
-        # Shorten repo names for better readability
-        repo_label = row['repo'][:15] + '...' if len(row['repo']) > 15 else row['repo']
-        full_label = f"{row['org']}/{repo_label}"
-
-        # Adjust label position based on bubble size
-        if row['total_usages'] > 1000:  # Large bubbles
-            xytext = (12, 12)
-            fontsize = 8
-        elif row['total_usages'] > 300:  # Medium bubbles
-            xytext = (8, 8)
-            fontsize = 7
-        else:  # Small bubbles
-            xytext = (5, 5)
-            fontsize = 6
-
-        plt.annotate(
+    repo_rows = top_repos[['total_usages', 'file']].itertuples(index=False, name=None)
+    for bucket, full_label, (x_pos, y_pos) in zip(repo_buckets, repo_labels, repo_rows):
+        ax.annotate(
             full_label,
             (x_pos, y_pos),
-            xytext=xytext,
+            xytext=repo_xytexts[bucket],
             textcoords='offset points',
-            fontsize=fontsize,
+            fontsize=repo_fontsizes[bucket],
             ha='left',
             va='bottom',
             weight='bold',
             bbox=dict(boxstyle='round,pad=0.2', facecolor='white', alpha=0.8, edgecolor='gray')
         )
 
-    plt.xlabel('Total Hugging Face Usages', fontsize=12)
-    plt.ylabel('Number of Files', fontsize=12)
-    plt.title('Top Repositories by Hugging Face Usage\n(Bubble size = total usages, Color = unsafe usages)', fontsize=14, weight='bold')
-    plt.grid(True, alpha=0.3)
+    ax.set_xlabel('Total Hugging Face Usages', fontsize=12)
+    ax.set_ylabel('Number of Files', fontsize=12)
+    ax.set_title('Top Repositories by Hugging Face Usage\n(Bubble size = total usages, Color = unsafe usages)', fontsize=14, weight='bold')
+    ax.grid(True, alpha=0.3)
 
     # Add colorbar for unsafe usages
-    cbar_repos = plt.colorbar(scatter_repos)
+    cbar_repos = fig.colorbar(scatter_repos, ax=ax)
     cbar_repos.set_label('Unsafe Usages', fontsize=10)
 
-    plt.tight_layout()
+    fig.tight_layout()
 
     # Save the repositories chart
     repo_output_file = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'hfscanner_repositories.png')
-    plt.savefig(repo_output_file, dpi=300, bbox_inches='tight')
+    fig.savefig(repo_output_file, dpi=FIGURE_DPI)
     print(f"Repositories chart saved to: {repo_output_file}")
 
-    plt.show()
+    if SHOW_PLOTS:
+        plt.show()
+    plt.close(fig)
 
     return org_stats, repo_stats
 
-def create_safety_trend_analysis(df):
+def create_safety_trend_analysis(repo_stats):
     """
     Create safety trend analysis scatter plot showing safety ratio vs total usages
     """
-    # Calculate safety metrics for each repository
-    repo_safety = df.groupby(['org', 'repo']).agg({
-        'safe_usages': 'sum',
-        'partial_usages': 'sum',
-        'unsafe_usages': 'sum',
-        'file': 'count'
-    }).reset_index()
-
-    repo_safety['total_usages'] = repo_safety['safe_usages'] + repo_safety['partial_usages'] + repo_safety['unsafe_usages']
+    # Work on a copy so the caller's repo_stats is left untouched
+    repo_safety = repo_stats.copy()
 
     # Calculate safety ratio (safe / total) - handle division by zero
-    repo_safety['safety_ratio'] = repo_safety.apply(
-        lambda row: row['safe_usages'] / row['total_usages'] if row['total_usages'] > 0 else 0,
-        axis=1
-    )
+    repo_safety['safety_ratio'] = (repo_safety['safe_usages'] / repo_safety['total_usages'].replace(0, np.nan)).fillna(0.0)
 
     # Filter out repos with very low usage (less than 1 total usages) for better analysis
     significant_repos = repo_safety[repo_safety['total_usages'] >= 1].copy()
 
     # Create the scatter plot
-    plt.figure(figsize=(14, 10))
+    fig, ax = plt.subplots(figsize=(14, 10))
 
     # Create scatter plot with simple points
-    plt.scatter(
+    ax.scatter(
         significant_repos['total_usages'],
         significant_repos['safety_ratio'],
         alpha=0.7,
         color='blue',
         edgecolors='black',
-        linewidth=0.5
+        linewidth=0.5,
+        rasterized=True
     )
 
-    # Add labels for top repositories (high usage or high safety)
-    top_repos = significant_repos.nlargest(15, 'total_usages')
-    high_safety_repos = significant_repos[significant_repos['safety_ratio'] >= 0.1].nlargest(20, 'total_usages')  # Changed from 0.5 to 0.1 (10%)
-
-    # Always include all repositories with safety ratio > 0.4
-    very_safe_repos = significant_repos[significant_repos['safety_ratio'] > 0.4]
-
-    # Combine and deduplicate for labeling
-    labeled_repos = pd.concat([top_repos, high_safety_repos, very_safe_repos]).drop_duplicates(subset=['org', 'repo'])
-
     # Add labels for repositories meeting criteria: safety ratio > 0.4 OR total usages > 750
     labeled_repos = significant_repos[
         (significant_repos['safety_ratio'] > 0.4) |
         (significant_repos['total_usages'] > 750)
-    ].copy()
-
-    for idx, row in labeled_repos.iterrows():
-        # Create shortened label
-        repo_label = row['repo'][:12] + '...' if len(row['repo']) > 12 else row['repo']
-        full_label = f"{row['org']}/{repo_label}"
-
-        # Position label to avoid overlap
-        x_pos = row['total_usages']
-        y_pos = row['safety_ratio']
-
-        # Adjust label position based on location
-        if row['safety_ratio'] > 0.5:  # High safety
-            xytext = (5, 5)
-            fontsize = 8
-        elif row['total_usages'] > 1000:  # High usage
-            xytext = (5, -5)
-            fontsize = 8
-        else:
-            xytext = (3, 3)
-            fontsize = 7
+    ]
+
+    # Adjust label position based on location: high safety, then high usage, then everything else
+    label_styles = np.select(
+        [labeled_repos['safety_ratio'].to_numpy() > 0.5, labeled_repos['total_usages'].to_numpy() > 1000],
+        [0, 1],
+        default=2
+    )
+    label_xytexts = [(5, 5), (5, -5), (3, 3)]
+    label_fontsizes = [8, 8, 7]
+
+    # Create shortened labels
+    labels = format_repo_labels(labeled_repos, 12)
 
-        plt.annotate(
+    label_rows = labeled_repos[['total_usages', 'safety_ratio']].itertuples(index=False, name=None)
+    for style, full_label, (x_pos, y_pos) in zip(label_styles, labels, label_rows):
+        ax.annotate(
             full_label,
             (x_pos, y_pos),
-            xytext=xytext,
+            xytext=label_xytexts[style],
             textcoords='offset points',
-            fontsize=fontsize,
+            fontsize=label_fontsizes[style],
             ha='left',
             va='bottom',
             weight='bold',
@@ -275,72 +337,78 @@ def create_safety_trend_analysis(df):
         )
 
     # Add reference lines
-    plt.axhline(y=0.5, color='green', linestyle='--', alpha=0.7, label='50% Safety Threshold')
-    plt.axhline(y=0.25, color='orange', linestyle='--', alpha=0.7, label='25% Safety Threshold')
-    plt.axhline(y=0.1, color='red', linestyle='--', alpha=0.7, label='10% Safety Threshold')
+    ax.axhline(y=0.5, color='green', linestyle='--', alpha=0.7, label='50% Safety Threshold')
+    ax.axhline(y=0.25, color='orange', linestyle='--', alpha=0.7, label='25% Safety Threshold')
+    ax.axhline(y=0.1, color='red', linestyle='--', alpha=0.7, label='10% Safety Threshold')
 
     # Add quadrants
     max_usage = significant_repos['total_usages'].max()
-    plt.axvline(x=max_usage/2, color='gray', linestyle=':', alpha=0.5)
+    ax.axvline(x=max_usage/2, color='gray', linestyle=':', alpha=0.5)
 
     # Add quadrant labels
-    plt.text(max_usage*0.75, 0.75, 'High Usage\nHigh Safety', ha='center', va='center',
-             bbox=dict(boxstyle='round,pad=0.5', facecolor='lightgreen', alpha=0.7))
-    plt.text(max_usage*0.75, 0.25, 'High Usage\nLow Safety', ha='center', va='center',
-             bbox=dict(boxstyle='round,pad=0.5', facecolor='lightcoral', alpha=0.7))
-    plt.text(max_usage*0.25, 0.75, 'Low Usage\nHigh Safety', ha='center', va='center',
-             bbox=dict(boxstyle='round,pad=0.5', facecolor='lightblue', alpha=0.7))
-    plt.text(max_usage*0.25, 0.25, 'Low Usage\nLow Safety', ha='center', va='center',
-             bbox=dict(boxstyle='round,pad=0.5', facecolor='lightyellow', alpha=0.7))
+    ax.text(max_usage*0.75, 0.75, 'High Usage\nHigh Safety', ha='center', va='center',
+            bbox=dict(boxstyle='round,pad=0.5', facecolor='lightgreen', alpha=0.7))
+    ax.text(max_usage*0.75, 0.25, 'High Usage\nLow Safety', ha='center', va='center',
+            bbox=dict(boxstyle='round,pad=0.5', facecolor='lightcoral', alpha=0.7))
+    ax.text(max_usage*0.25, 0.75, 'Low Usage\nHigh Safety', ha='center', va='center',
+            bbox=dict(boxstyle='round,pad=0.5', facecolor='lightblue', alpha=0.7))
+    ax.text(max_usage*0.25, 0.25, 'Low Usage\nLow Safety', ha='center', va='center',
+            bbox=dict(boxstyle='round,pad=0.5', facecolor='lightyellow', alpha=0.7))
 
-    plt.xlabel('Total Hugging Face Usages', fontsize=12)
-    plt.ylabel('Safety Ratio (Safe/Total)', fontsize=12)
-    plt.title('Safety Trend Analysis: Safety Ratio vs Total Usages', fontsize=14, weight='bold')
+    ax.set_xlabel('Total Hugging Face Usages', fontsize=12)
+    ax.set_ylabel('Safety Ratio (Safe/Total)', fontsize=12)
+    ax.set_title('Safety Trend Analysis: Safety Ratio vs Total Usages', fontsize=14, weight='bold')
 
-    plt.grid(True, alpha=0.3)
-    plt.legend()
+    ax.grid(True, alpha=0.3)
+    ax.legend()
 
-    plt.tight_layout()
+    fig.tight_layout()
 
     # Save the safety trend chart
     safety_output_file = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'hfscanner_safety_trend.png')
-    plt.savefig(safety_output_file, dpi=300, bbox_inches='tight')
+    fig.savefig(safety_output_file, dpi=FIGURE_DPI)
     print(f"Safety trend analysis saved to: {safety_output_file}")
 
-    plt.show()
+    if SHOW_PLOTS:
+        plt.show()
+    plt.close(fig)
 
     # Print safety statistics
     print("\n" + "=" * 80)
     print("SAFETY TREND ANALYSIS STATISTICS")
     print("=" * 80)
 
-    print(f"Total repositories analyzed: {len(significant_repos)}")
-    print(f"Repositories with 50%+ safety ratio: {len(significant_repos[significant_repos['safety_ratio'] >= 0.5])}")
-    print(f"Repositories with 25%+ safety ratio: {len(significant_repos[significant_repos['safety_ratio'] >= 0.25])}")
-    print(f"Repositories with 10%+ safety ratio: {len(significant_repos[significant_repos['safety_ratio'] >= 0.1])}")
-    print(f"Repositories with 0% safety ratio: {len(significant_repos[significant_repos['safety_ratio'] == 0])}")
+    # Sort the ratios once; each threshold count is then a binary search
+    sorted_ratios = np.sort(significant_repos['safety_ratio'].to_numpy())
+    n_repos = sorted_ratios.size
+    at_least_50, at_least_25, at_least_10 = n_repos - np.searchsorted(sorted_ratios, [0.5, 0.25, 0.1], side='left')
+    zero_safety = np.searchsorted(sorted_ratios, 0, side='right')
+
+    print(f"Total repositories analyzed: {n_repos}")
+    print(f"Repositories with 50%+ safety ratio: {at_least_50}")
+    print(f"Repositories with 25%+ safety ratio: {at_least_25}")
+    print(f"Repositories with 10%+ safety ratio: {at_least_10}")
+    print(f"Repositories with 0% safety ratio: {zero_safety}")
+
+    # Order by usage once (stable, so ties keep nlargest's first-seen order) and slice the top-K lists from it
+    usage_order = np.argsort(-significant_repos['total_usages'].to_numpy(), kind='stable')
+    repos_by_usage = significant_repos.iloc[usage_order]
 
     print("\nTop 10 Safest Repositories (50%+ safety ratio):")
-    safest_repos = significant_repos[significant_repos['safety_ratio'] >= 0.5].nlargest(10, 'total_usages')
-    for idx, row in safest_repos.iterrows():
-        safety_pct = row['safety_ratio'] * 100
-        print(f"  {row['org']}/{row['repo']}: {safety_pct:.1f}% safe ({row['total_usages']} total usages)")
+    safest_repos = repos_by_usage[repos_by_usage['safety_ratio'] >= 0.5].head(10)
+    print_repo_safety(safest_repos)
 
     print("\nAll Repositories with 10%+ Safety Ratio:")
     good_safety_repos = significant_repos[significant_repos['safety_ratio'] >= 0.1].sort_values('safety_ratio', ascending=False)
-    for idx, row in good_safety_repos.iterrows():
-        safety_pct = row['safety_ratio'] * 100
-        print(f"  {row['org']}/{row['repo']}: {safety_pct:.1f}% safe ({row['total_usages']} total usages)")
+    print_repo_safety(good_safety_repos)
 
     print("\nHigh-Risk Repositories (High usage, Low safety):")
-    high_risk = significant_repos[
-        (significant_repos['total_usages'] > significant_repos['total_usages'].median()) &
-        (significant_repos['safety_ratio'] < 0.1)
-    ].nlargest(10, 'total_usages')
+    high_risk = repos_by_usage[
+        (repos_by_usage['total_usages'] > significant_repos['total_usages'].median()) &
+        (repos_by_usage['safety_ratio'] < 0.1)
+    ].head(10)
 
-    for idx, row in high_risk.iterrows():
-        safety_pct = row['safety_ratio'] * 100
-        print(f"  {row['org']}/{row['repo']}: {safety_pct:.1f}% safe ({row['total_usages']} total usages)")
+    print_repo_safety(high_risk)
 
     return significant_repos
 
@@ -365,19 +433,26 @@ def display_dataframe_info(df):
     print("=" * 80)
     print(df.head(10).to_string(index=False))
 
-    print("\n" + "=" * 80)
-    print("BASIC STATISTICS")
-    print("=" * 80)
-    print(df.describe())
+    # Summary statistics are diagnostic only, so they are opt-in
+    if VERBOSE:
+        print("\n" + "=" * 80)
+        print("BASIC STATISTICS")
+        print("=" * 80)
+        print(df.describe(percentiles=[], include='number'))
 
     print("\n" + "=" * 80)
     print("UNIQUE VALUES")
     print("=" * 80)
     print(f"Unique organizations: {df['org'].nunique()}")
     print(f"Unique repositories: {df['repo'].nunique()}")
-    print(f"Files with safe usages: {len(df[df['safe_usages'] > 0])}")
-    print(f"Files with partial usages: {len(df[df['partial_usages'] > 0])}")
-    print(f"Files with unsafe usages: {len(df[df['unsafe_usages'] > 0])}")
+
+    # Usage counts are never negative, so non-zero means "has usages"
+    safe_files = np.count_nonzero(df['safe_usages'].to_numpy())
+    partial_files = np.count_nonzero(df['partial_usages'].to_numpy())
+    unsafe_files = np.count_nonzero(df['unsafe_usages'].to_numpy())
+    print(f"Files with safe usages: {safe_files}")
+    print(f"Files with partial usages: {partial_files}")
+    print(f"Files with unsafe usages: {unsafe_files}")
 
     print("\n" + "=" * 80)
     print("USAGE SUMMARY")
@@ -392,26 +467,37 @@ def main():
     Main function to load and display the data
     """
     try:
-        # Load the data
-        df = load_hfscanner_data()
+        if CHUNK_SIZE:
+            # Stream the CSV; only the per-repository totals are kept in memory
+            repo_stats = stream_repo_stats(CHUNK_SIZE)
+            result = repo_stats
+            print(f"Streamed hfscanner.csv in chunks of {CHUNK_SIZE} rows (file-level summary skipped)")
+        else:
+            # Load the data
+            df = load_hfscanner_data()
+
+            # Exclude huggingface/transformers from all visualizations
+            df_filtered = exclude_huggingface_transformers(df).copy()
+            result = df_filtered
+
+            # Display information about the DataFrame as read from the CSV (without the derived total)
+            display_dataframe_info(df_filtered.drop(columns='total_usages'))
 
-        # Exclude huggingface/transformers from all visualizations
-        df_filtered = df[~((df['org'] == 'huggingface') & (df['repo'] == 'transformers'))].copy()
+            repo_stats = aggregate_repo_stats(df_filtered)
 
-        # Display information about the DataFrame
-        display_dataframe_info(df_filtered)
+        org_stats = aggregate_org_stats(repo_stats)
 
         # Create bubble charts
         print("\n" + "=" * 80)
         print("GENERATING BUBBLE CHARTS")
         print("=" * 80)
-        org_stats, repo_stats = create_bubble_charts(df_filtered)
+        org_stats, repo_stats = create_bubble_charts(org_stats, repo_stats)
 
         # Create safety trend analysis
         print("\n" + "=" * 80)
         print("GENERATING SAFETY TREND ANALYSIS")
         print("=" * 80)
-        safety_data = create_safety_trend_analysis(df_filtered)
+        safety_data = create_safety_trend_analysis(repo_stats)
 
         # Display top organizations and repositories
         print("\n" + "=" * 80)
@@ -426,7 +512,8 @@ def main():
         top_repos = repo_stats.nlargest(10, 'total_usages')[['org', 'repo', 'total_usages', 'safe_usages', 'partial_usages', 'unsafe_usages', 'file']]
         print(top_repos.to_string(index=False))
 
-        return df_filtered
+        # The file-level frame, or the per-repository totals when streaming
+        return result
 
     except FileNotFoundError:
         print("Error: hfscanner.csv file not found in the results directory")